@@ -22,14 +22,16 @@
 # -------------------
 
 import vlc
+import functools
+import sys
 import threading
 import time
 import unicodedata
+from types import MappingProxyType
 from . import somafm_track_retriever as somaretriever
 from . import hutton_orbital_track_retriever as huttonretriever
 from . import deejay_track_retriever as deejayretriever
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import Any, Literal, Callable, Optional
 from lib.PluginBase import PluginBase, PluginManifest
 from lib.PluginHelper import PluginHelper, PluginEvent
@@ -55,10 +57,36 @@ LAZY_INTERVAL_STANDARD = 90  # seconds for lazy mode (standard stations)
 LAZY_INTERVAL_SPECIAL = 100  # seconds for lazy mode (SomaFM/Hutton)
 ACTIVE_INTERVAL_STANDARD = 15  # seconds for active mode (standard stations)
 ACTIVE_INTERVAL_SPECIAL = 20 # seconds for active mode (SomaFM/Hutton)
+TRACK_PERIOD_WEIGHT = 0.2  # EWMA weight of the latest observed track length
+TRACK_PERIOD_MIN = 30  # seconds; shorter gaps (jingles, retries) are not track lengths
+TRACK_PERIOD_MAX = 1800  # seconds; longer gaps (talk shows, outages) are ignored
 COMMAND_RESPONSE_DELAY = 10  # seconds to wait after command before announcing
 MIN_EVENT_INTERVAL = 5  # minimum seconds between track announcements
+VOLUME_RETRY_DELAY = 0.5  # seconds before retrying a volume change VLC was not ready for
+VOLUME_RETRY_ATTEMPTS = 10  # retries before giving up on a refused volume change
 GRACE_PERIOD = 1.5  # seconds for projection update grace period
 MIN_TITLE_LENGTH = 3  # minimum length for valid titles
+ANNOUNCE_RATE = 1 / 60  # automatic announcements regained per second, per station
+ANNOUNCE_BURST = 2  # automatic announcements a station may make back to back
+COMPAT_TITLE_FOLDING = False  # also fold compatibility characters (NFKC) when comparing titles
+META_DEBOUNCE_INTERVAL = 0.5  # seconds to coalesce bursts of identical metadata updates
+
+# libVLC options: small network buffer for fast start, audio only
+NETWORK_CACHING_MS = 300
+VLC_INSTANCE_ARGS = [
+    f"--network-caching={NETWORK_CACHING_MS}",
+    "--http-reconnect",
+    "--clock-jitter=0",
+    "--clock-synchro=0",
+    "--no-video",
+    "--vout=none",
+    "--no-spu",
+    "--no-osd",
+    "--quiet",
+]
+# Shared libVLC instance, reused across station changes. python-vlc returns None when libVLC
+# rejects an option (older builds), so fall back to the defaults; None here means no usable libVLC.
+_VLC_INSTANCE = vlc.Instance(VLC_INSTANCE_ARGS) or vlc.Instance()
 
 # ---------------------------------------------------------------------
 # Pydantic models for action parameters
@@ -81,7 +109,7 @@ class EnableAnnouncementsParameters(BaseModel):
 # ---------------------------------------------------------------------
 # Pre-installed radio stations
 # ---------------------------------------------------------------------
-RADIO_STATIONS = {
+_RAW_RADIO_STATIONS = {
     "Radio Sidewinder": {
         "url": "https://radiosidewinder.out.airtime.pro:8000/radiosidewinder_b",
         "description": "Fan-made station for Elite Dangerous with ambient and techno music, in-game news and ads."
@@ -167,31 +195,106 @@ RADIO_STATIONS = {
         "description": "For the blacklight dwellers.\nEverything is Synthetic"
     }
 }
+# Read-only view of the station table; it must not change after import
+RADIO_STATIONS = MappingProxyType({name: MappingProxyType(info) for name, info in _RAW_RADIO_STATIONS.items()})
+# In-memory radio state template, copied whenever the state is reset
+_EMPTY_RADIO_STATE = {
+    "current_station": None,
+    "current_title": None,
+    "last_updated": 0.0,
+    "command_triggered": False
+}
+# Station names, and a case-insensitive lookup returning (canonical name, url)
+_STATION_KEYS = tuple(RADIO_STATIONS)
+_STATION_URLS = {name: info["url"] for name, info in RADIO_STATIONS.items()}
+_STATIONS_CI = {name.casefold(): (name, url) for name, url in _STATION_URLS.items()}
+# Stations whose titles come from a dedicated retriever instead of VLC metadata
+SOMAFM_STATIONS = frozenset(name for name, url in _STATION_URLS.items() if "somafm.com" in url)
+HUTTON_STATIONS = frozenset({"Hutton Orbital Radio"})
+DEEJAY_STATIONS = frozenset(name for name in RADIO_STATIONS if "deejay" in name.lower())
+# BigFM and Radio Capital stream mp3 but VLC reads their metadata fine
+MP3_STATIONS = frozenset(
+    name for name, url in _STATION_URLS.items()
+    if (url.endswith(".mp3") or "/mp3" in url) and name not in ("BigFM", "Radio Capital")
+)
+SPECIAL_STATIONS = SOMAFM_STATIONS | HUTTON_STATIONS | DEEJAY_STATIONS | MP3_STATIONS
+# Title source of each special station; later entries take precedence, matching the retriever order
+_STATION_KINDS = {
+    **dict.fromkeys(MP3_STATIONS, "mp3"),
+    **dict.fromkeys(DEEJAY_STATIONS, "deejay"),
+    **dict.fromkeys(HUTTON_STATIONS, "hutton"),
+    **dict.fromkeys(SOMAFM_STATIONS, "somafm"),
+}
+# (lazy, active) monitoring intervals per station
+STATION_INTERVALS = {
+    name: (LAZY_INTERVAL_SPECIAL, ACTIVE_INTERVAL_SPECIAL) if name in SPECIAL_STATIONS
+    else (LAZY_INTERVAL_STANDARD, ACTIVE_INTERVAL_STANDARD)
+    for name in RADIO_STATIONS
+}
+_DEFAULT_INTERVALS = (LAZY_INTERVAL_STANDARD, ACTIVE_INTERVAL_STANDARD)
+_STATIONS_HTML = (
+    "<p>The following radio stations are available:</p><ul>"
+    + "".join(f"<li><strong>{name}</strong>: {info['description']}</li>" for name, info in RADIO_STATIONS.items())
+    + "</ul>"
+)
+_PLAY_RADIO_DESCRIPTION = f"Play a webradio station, available stations: {', '.join(_STATION_KEYS)}"
+# ---------------------------------------------------------------------
+# Placeholder player
+# ---------------------------------------------------------------------
+class _NullPlayer:
+    """No-op stand-in for the VLC player until the first station is played."""
+    audio_set_volume = staticmethod(lambda volume: -1)
+    get_media = staticmethod(lambda: None)
+    stop = staticmethod(lambda: None)
+    release = staticmethod(lambda: None)
+
+_NULL_PLAYER = _NullPlayer()
+
 # ---------------------------------------------------------------------
 # Helper logger
 # ---------------------------------------------------------------------
+_LOG_THRESHOLD = _LEVELS.get(PLUGIN_LOG_LEVEL.upper(), 999)
+# Check before building f-strings for DEBUG messages on hot paths
+_DEBUG_ENABLED = _LEVELS["DEBUG"] >= _LOG_THRESHOLD
+
 def p_log(level: str, *args):
-    """Custom logger for RadioPlugin with prefix."""
-    try:
-        lvl = _LEVELS.get(level.upper(), 999)
-        threshold = _LEVELS.get(PLUGIN_LOG_LEVEL.upper(), 999)
-        if lvl >= threshold:
-            log(level, "[RadioPlugin]", *args)
-    except Exception as e:
-        log("ERROR", "[RadioPlugin] Logging failure:", e)
+    """Custom logger for RadioPlugin with prefix. Level must be upper-case."""
+    if _LEVELS.get(level, 999) >= _LOG_THRESHOLD:
+        log(level, "[RadioPlugin]", *args)
+
+# ---------------------------------------------------------------------
+# Title normalization
+# ---------------------------------------------------------------------
+@functools.lru_cache(maxsize=512)
+def _norm_title(title: str) -> str:
+    """Caseless form of a title, NFC(casefold(NFD(title))); cached since the same titles come back on every check.
+    
+    Results are interned, so spellings that fold to the same title compare by identity.
+    """
+    title = title.strip()
+    # Normalization is a no-op on ASCII, where casefold() is lower()
+    if title.isascii():
+        return sys.intern(title.lower())
+    folded = unicodedata.normalize('NFD', title).casefold()
+    if COMPAT_TITLE_FOLDING:
+        folded = unicodedata.normalize('NFKC', folded).casefold()
+    return sys.intern(unicodedata.normalize('NFC', folded))
 
 # ---------------------------------------------------------------------
 # Track monitoring state class
 # ---------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True, eq=False)
 class MonitorState:
     """Encapsulates the state of the track monitor."""
     current_station: Optional[str] = None
+    # Title source of the current station ("somafm", "hutton", "deejay", "mp3"), None for VLC metadata
+    station_kind: Optional[str] = None
     last_title: str = ""
     last_normalized_title: str = ""
     last_event_time: float = 0
-    last_check_time: float = 0
     command_triggered: bool = False
+    # No announcements before this time, so Covas can answer the command first
+    announce_after: float = 0
     
     # Lazy/active monitoring state
     is_lazy_mode: bool = True
@@ -202,28 +305,50 @@ class MonitorState:
     lazy_interval: int = LAZY_INTERVAL_STANDARD
     active_interval: int = ACTIVE_INTERVAL_STANDARD
     
-    # Title repeat tracking
-    title_repeat_count: dict = field(default_factory=dict)
+    # Observed track lengths: time of the last title change and per-station EWMA (kept across stations)
+    last_change_time: float = 0
+    track_period_ewma: dict = field(default_factory=dict)
     
     @property
-    def current_interval(self) -> int:
-        """Get the current check interval based on monitoring mode."""
-        return self.lazy_interval if self.is_lazy_mode else self.active_interval
+    def current_interval(self) -> float:
+        """Get the current check interval.
+        
+        Once the typical track length of the station is known, wait half the time left until
+        the next expected change, so checks get denser as it approaches. Until then, use the
+        lazy/active interval of the current monitoring mode.
+        """
+        period = self.track_period_ewma.get(self.current_station)
+        if period is None or not self.last_change_time:
+            return self.lazy_interval if self.is_lazy_mode else self.active_interval
+        remaining = period - (time.monotonic() - self.last_change_time)
+        return max(self.active_interval, min(self.lazy_interval, remaining / 2))
+    
+    def record_track_change(self, now: float) -> None:
+        """Update the station's typical track length with an observed title change."""
+        if self.last_change_time:
+            elapsed = now - self.last_change_time
+            if TRACK_PERIOD_MIN <= elapsed <= TRACK_PERIOD_MAX:
+                period = self.track_period_ewma.get(self.current_station)
+                period = elapsed if period is None else (1 - TRACK_PERIOD_WEIGHT) * period + TRACK_PERIOD_WEIGHT * elapsed
+                self.track_period_ewma[self.current_station] = period
+                if _DEBUG_ENABLED:
+                    p_log("DEBUG", f"Typical track length on {self.current_station}: {period:.0f}s")
+        self.last_change_time = now
     
     def update_intervals_for_station(self, station_name: str) -> None:
         """Update intervals based on station type."""
-        is_special = RadioPlugin.is_special_station(station_name)
-        self.lazy_interval = LAZY_INTERVAL_SPECIAL if is_special else LAZY_INTERVAL_STANDARD
-        self.active_interval = ACTIVE_INTERVAL_SPECIAL if is_special else ACTIVE_INTERVAL_STANDARD
-        p_log("DEBUG", f"Updated intervals for {station_name}: lazy={self.lazy_interval}s, active={self.active_interval}s")
+        self.lazy_interval, self.active_interval = STATION_INTERVALS.get(station_name, _DEFAULT_INTERVALS)
+        if _DEBUG_ENABLED:
+            p_log("DEBUG", f"Updated intervals for {station_name}: lazy={self.lazy_interval}s, active={self.active_interval}s")
     
     def reset_for_station_change(self, new_station: str) -> None:
         """Reset monitoring state when station changes."""
         self.current_station = new_station
+        self.station_kind = _STATION_KINDS.get(new_station)
         self.last_title = ""
         self.last_normalized_title = ""
         self.last_event_time = 0
-        self.last_check_time = 0
+        self.last_change_time = 0
         self.is_lazy_mode = True
         self.checks_without_change = 0
         self.prev_check_title = None
@@ -237,24 +362,45 @@ class RadioPlugin(PluginBase):
     def __init__(self, plugin_manifest: PluginManifest):
         super().__init__(plugin_manifest)
         self.current_station = None
-        self.player = None
+        self.player = _NULL_PLAYER
         self.playing = False
+        # Last volume VLC accepted through set_volume; None until then, so the default volume applies
+        self.volume: Optional[int] = None
+        # Volume change still being retried while the stream starts, if any
+        self._pending_volume: Optional[int] = None
         self.track_monitor_thread = None
         self.monitor_state = MonitorState()
+        # Stop flag of the current monitor thread; every thread started gets its own
         self.stop_monitor = threading.Event()
-        self._last_replied_title = None
-        self._last_replied_station = None
-        self._last_reply_time = 0
+        # Set by libVLC metadata callbacks (and on stop) to wake the monitor early
+        self._monitor_wakeup = threading.Event()
+        self._media_event_manager = None
+        # VLC title cache, refreshed only after a MediaMetaChanged event
+        self._vlc_meta_dirty = True
+        self._vlc_title = ""
+        # Last (display title, normalized title) pair seen by the monitor
+        self._norm_memo: tuple[Optional[str], str] = (None, "")
+        # Media objects keyed by station URL
+        self._media_cache: dict[str, vlc.Media] = {}
+        # Last reply as (normalized title, station, time), replaced in a single assignment
+        self._reply_cache: tuple[str, Optional[str], float] = ("", None, 0.0)
         self.helper = None
-        self._title_repeat_count = {}
+        # Snapshot of plugin settings, refreshed on chat start and by enable_announcements
+        self._announcements_enabled = ENABLED
+        self._default_volume = DEFAULT_VOLUME
+        # Announcement token buckets as station -> (tokens, last refill time)
+        self._announce_bucket: dict[str, tuple[float, float]] = {}
+        # Title retriever per station kind (see _STATION_KINDS); None reads VLC metadata
+        self._track_fetchers: dict[Optional[str], Callable[[str], str]] = {
+            "somafm": somaretriever.get_somafm_track_info,
+            "hutton": lambda station_name: huttonretriever.get_hutton_track_info(),
+            "deejay": deejayretriever.get_deejay_track_info,
+            "mp3": self._get_mp3_title,
+            None: self._get_vlc_title,
+        }
         
         # In-memory state to replace projection
-        self._radio_state = {
-            "current_station": None,
-            "current_title": None,
-            "last_updated": 0.0,
-            "command_triggered": False
-        }
+        self._radio_state = dict(_EMPTY_RADIO_STATE)
         p_log("DEBUG", f"_radio_state initialized: {self._radio_state}")
         self.settings_config: PluginSettings | None = PluginSettings(
             key="RadioPlugin",
@@ -293,7 +439,7 @@ class RadioPlugin(PluginBase):
                             label="Available Stations",
                             type="paragraph",
                             readonly=True,
-                            content=self._generate_stations_html()
+                            content=_STATIONS_HTML
                         )
                     ]
                 )
@@ -303,25 +449,21 @@ class RadioPlugin(PluginBase):
     # -----------------------------------------------------------------
     # Plugin setup
     # -----------------------------------------------------------------
-    def _generate_stations_html(self) -> str:
-        html = "<p>The following radio stations are available:</p><ul>"
-        for name, info in RADIO_STATIONS.items():
-            html += f"<li><strong>{name}</strong>: {info['description']}</li>"
-        html += "</ul>"
-        return html
-
     def on_chat_start(self, helper: PluginHelper):
         """Initialize plugin when chat starts."""
         # Register actions
         self.helper = helper
         self.register_actions(helper)
+        # Settings are only edited between chats, so read them once here
+        self._announcements_enabled = bool(self.settings.get('enable_radio_plugin', ENABLED))
+        self._default_volume = int(self.settings.get('default_volume', DEFAULT_VOLUME))
         
         p_log("DEBUG", "Reply check function registered successfully")
         # Register the radio_changed event
         helper.register_event(
             name="radio_changed",
-            should_reply_check=lambda event: self._should_reply_to_radio_event(event),
-            prompt_generator=lambda event: self._generate_radio_prompt(event)
+            should_reply_check=self._should_reply_to_radio_event,
+            prompt_generator=self._generate_radio_prompt
         )
         
         p_log("INFO", "RadioPlugin initialized successfully")
@@ -332,96 +474,46 @@ class RadioPlugin(PluginBase):
     @staticmethod
     def is_somafm_station(station_name: str) -> bool:
         """Check if a station name refers to a SomaFM station."""
-        if not station_name:
-            return False
-            
-        station_name_lower = station_name.lower()
-        
-        # Check if it's explicitly marked as SomaFM in the name
-        if "somafm" in station_name_lower or "soma.fm" in station_name_lower:
-            return True
-        
-        # Check if it's one of the known SomaFM stations
-        somafm_station_names = [
-            "deepspaceone", "deep space one", 
-            "groovesalad", "groove salad", 
-            "spacestation", "space station", 
-            "secretagent", "secret agent", 
-            "defcon", "lush", "synphaera"
-        ]
-        
-        for somafm_name in somafm_station_names:
-            if somafm_name in station_name_lower:
-                return True
-        
-        # Check if it's in our RADIO_STATIONS dictionary and has a SomaFM URL
-        if station_name in RADIO_STATIONS:
-            url = RADIO_STATIONS[station_name].get("url", "")
-            if "somafm.com" in url or "ice.somafm.com" in url:
-                return True
-        
-        return False
+        return station_name in SOMAFM_STATIONS
     
     @staticmethod
     def is_hutton_station(station_name: str) -> bool:
         """Check if a station name refers to Hutton Orbital Radio."""
-        if not station_name:
-            return False
-        return "hutton" in station_name.lower()
+        return station_name in HUTTON_STATIONS
         
     @staticmethod
     def is_deejay_station(station_name: str) -> bool:
         """Check if a station name refers to Radio Deejay."""
-        if not station_name:
-            return False
-        return "deejay" in station_name.lower()
+        return station_name in DEEJAY_STATIONS
     # Static Method for MP3 Stream Detection
     @staticmethod
     def is_mp3_stream(station_name: str) -> bool:
-        """Check if a station uses an MP3 stream format."""
-        if not station_name:
-            return False
-        # Check if the station exists in our dictionary
-        if station_name in RADIO_STATIONS:
-            url = RADIO_STATIONS[station_name].get("url", "")
-            # Check if URL ends with .mp3 or contains mp3 in the path
-            url = RADIO_STATIONS[station_name].get("url", "")
-            if (url.endswith('.mp3') or '/mp3' in url) and ('BigFM' not in station_name or 'Capital' not in station_name): # Exclude BigFM and Radio Capital which uses mp3 but has its own handling
-                return True
-        return False    
+        """Check if a station uses an MP3 stream format read through the MP3 retriever."""
+        return station_name in MP3_STATIONS
     @staticmethod
     def is_special_station(station_name: str) -> bool:
-        """Check if a station requires special handling (SomaFM or Hutton)."""
-        return (RadioPlugin.is_somafm_station(station_name) or 
-                RadioPlugin.is_hutton_station(station_name) or 
-                RadioPlugin.is_deejay_station(station_name) or
-                RadioPlugin.is_mp3_stream(station_name))
+        """Check if a station requires special handling (SomaFM, Hutton, DeeJay or MP3 retriever)."""
+        return station_name in SPECIAL_STATIONS
     
     @staticmethod
     def normalize_title(title: str) -> str:
         """Normalize a track title for consistent comparison."""
         if not title:
             return ""
-        try:
-            return unicodedata.normalize('NFKC', title.strip()).casefold()
-        except Exception:
-            return title.strip().lower()
+        return _norm_title(title)
     # -----------------------------------------------------------------
     # Event handling
     # -----------------------------------------------------------------
     def _should_reply_to_radio_event(self, event: PluginEvent) -> bool:
         """Decide whether Covas should reply to a radio track change."""
         try:
-            content = event.plugin_event_content
-            title = content[0]
-            station = content[1]
-            command_triggered = content[2] if len(content) > 2 else False
-            event_time = content[3] if len(content) > 3 else time.time()
+            title, station, *rest = event.plugin_event_content
+            command_triggered = bool(rest and rest[0])
         except (ValueError, TypeError):
             p_log("ERROR", f"Invalid plugin_event_content format: {event.plugin_event_content}")
             return False
         # Skip if plugin announcements are disabled
-        if not self.settings.get('enable_radio_plugin', ENABLED):
+        if not self._announcements_enabled:
             p_log("DEBUG", "Radio plugin announcements are disabled in settings.")
             return False
         # Skip empty or invalid titles
@@ -430,64 +522,51 @@ class RadioPlugin(PluginBase):
             return False
     
         normalized_title = self.normalize_title(title)
-        last_title_norm = self.normalize_title(self._last_replied_title or "")
-        last_station = self._last_replied_station
-        current_time = time.time()
-    
-        # Create a unique key for the title+station combo
-        track_key = f"{normalized_title}|{station}"
+        last_title_norm, last_station, _ = self._reply_cache
+        current_time = time.monotonic()
     
         # Always allow command-triggered events
         if command_triggered:
-            p_log("DEBUG", f"Command triggered event, allowing reply for '{title}' on {station}")
+            if _DEBUG_ENABLED:
+                p_log("DEBUG", f"Command triggered event, allowing reply for '{title}' on {station}")
         
             # Update memory for future comparisons
-            self._last_replied_title = title
-            self._last_replied_station = station
-            self._last_reply_time = current_time
-        
-            # Reset counter for command-triggered events
-            self._title_repeat_count[track_key] = 0
-        
+            self._reply_cache = (normalized_title, station, current_time)
             return True
     
         # If same station and same title as last replied, suppress automatic announcements
         if normalized_title == last_title_norm and station == last_station:
-            p_log("DEBUG", f"Same title on same station and unchanged; suppressing announcement.")
+            p_log("DEBUG", "Same title on same station and unchanged; suppressing announcement.")
             return False
     
-        # For new titles or different stations, manage repeat counters
-        # Increment counter
-        self._title_repeat_count[track_key] = self._title_repeat_count.get(track_key, 0) + 1
-        if self._title_repeat_count[track_key] > 1:
-            p_log("DEBUG", f"Same title repeated {self._title_repeat_count[track_key]} times, ignoring")
+        # For new titles, throttle each station with a token bucket so flapping metadata can't flood replies
+        tokens, last_refill = self._announce_bucket.get(station, (ANNOUNCE_BURST, current_time))
+        tokens = min(ANNOUNCE_BURST, tokens + (current_time - last_refill) * ANNOUNCE_RATE)
+        if tokens < 1:
+            self._announce_bucket[station] = (tokens, current_time)
+            if _DEBUG_ENABLED:
+                p_log("DEBUG", f"Announcement rate limit reached on {station}, ignoring '{title}'")
             return False
-        else:
-            p_log("DEBUG", f"First occurrence of '{title}' after cooldown, allowing reply.")
+        self._announce_bucket[station] = (tokens - 1, current_time)
     
         # Update memory for future comparisons
-        self._last_replied_title = title
-        self._last_replied_station = station
-        self._last_reply_time = current_time
+        self._reply_cache = (normalized_title, station, current_time)
     
-        p_log("DEBUG", f"Will reply to '{title}' on {station}")
+        if _DEBUG_ENABLED:
+            p_log("DEBUG", f"Will reply to '{title}' on {station}")
         return True
     
     def _generate_radio_prompt(self, event: PluginEvent) -> str:
         """Generate prompt for radio track change events."""
         try:
-            content = event.plugin_event_content
-            if isinstance(content, list) and len(content) >= 2:
-                title = content[0]
-                station = content[1]
-            else:
-                raise ValueError(f"Expected list with at least 2 elements, got: {content}")
-        except (ValueError, TypeError) as e:
+            title, station, *_ = event.plugin_event_content
+        except (ValueError, TypeError):
             p_log("ERROR", f"Invalid plugin_event_content format in prompt generator: {event.plugin_event_content}")
             return "React to this radio track change. The track information could not be retrieved."
         
         prompt = f"React to this radio track change. New track: '{title}' on station '{station}'."
-        p_log("DEBUG", f"Generated radio prompt: {prompt}")
+        if _DEBUG_ENABLED:
+            p_log("DEBUG", f"Generated radio prompt: {prompt}")
         return prompt
     # -----------------------------------------------------------------
     # Action registration
@@ -495,7 +574,7 @@ class RadioPlugin(PluginBase):
     def register_actions(self, helper: PluginHelper):
         helper.register_action(
             name="play_radio",
-            description=f"Play a webradio station, available stations: {', '.join(RADIO_STATIONS.keys())}",
+            description=_PLAY_RADIO_DESCRIPTION,
             parameters=PlayRadioParameters,
             method=self.play_radio_action,
             action_type="global"
@@ -532,18 +611,14 @@ class RadioPlugin(PluginBase):
     # Action methods
     # -----------------------------------------------------------------
     def play_radio_action(self, model: PlayRadioParameters, context: dict) -> str:
-        station_name = model.station
-        station_info = RADIO_STATIONS.get(station_name)
-        if not station_info:
-            return f"Station {station_name} not found."
-        url = station_info['url']
-        return self._start_radio(url, station_name, self.helper)
+        return self._play_station(model.station)
     def change_radio_action(self, model: ChangeRadioParameters, context: dict) -> str:
-        station_name = model.station
-        station_info = RADIO_STATIONS.get(station_name)
-        if not station_info:
+        return self._play_station(model.station)
+    def _play_station(self, requested: str) -> str:
+        """Start a station by case-insensitive name; play and change behave the same."""
+        station_name, url = _STATIONS_CI.get(requested.casefold(), (requested, None))
+        if not url:
             return f"Station {station_name} not found."
-        url = station_info['url']
         return self._start_radio(url, station_name, self.helper)
     def set_volume_action(self, model: SetVolumeParameters, context: dict) -> str:
         volume = model.volume
@@ -553,20 +628,15 @@ class RadioPlugin(PluginBase):
     def enable_announcements_action(self, model: EnableAnnouncementsParameters, context: dict) -> str:
         enable = model.enable
         self.settings['enable_radio_plugin'] = enable
+        self._announcements_enabled = enable
         status = "enabled" if enable else "disabled"
-        #Start or stop the monitor thread based on new setting
-        if enable and self.playing and (not self.track_monitor_thread or not self.track_monitor_thread.is_alive()):
-            self.stop_monitor.clear()  # Reset the stop event
-            self.track_monitor_thread = threading.Thread(
-                target=self._monitor_track_changes, 
-                args=(self.helper,),
-                daemon=True  # Make thread daemon so it exits when main thread exits
-            )
-            self.track_monitor_thread.start()
-            p_log("INFO", "Radio plugin announcements enabled; starting track monitor.")
+        # Resume or park the track monitor based on new setting
+        if enable and self.playing:
+            self._ensure_track_monitor(self.helper)
+            p_log("INFO", "Radio plugin announcements enabled; resuming track monitor.")
         elif not enable:
-            self.stop_monitor.set()  # Signal the monitor thread to stop
-            p_log("INFO", "Radio plugin announcements disabled; stopping track monitor.")
+            self._monitor_wakeup.set()
+            p_log("INFO", "Radio plugin announcements disabled; parking track monitor.")
         p_log("INFO", f"Radio plugin announcements have been {status} via action.")
         return f"Radio plugin announcements have been {status}."
     # -----------------------------------------------------------------
@@ -576,83 +646,89 @@ class RadioPlugin(PluginBase):
         if self.playing:
             p_log("INFO", "Covas:NEXT stopped. Stopping radio playback.")
             self._stop_radio()
+        # End the track monitor, which otherwise stays parked between stations
+        self.stop_monitor.set()
+        self._monitor_wakeup.set()
+        self.player.release()
+        self.player = _NULL_PLAYER
 
     def _start_radio(self, url, station_name, helper: PluginHelper):
-        # Ensure proper cleanup of previous radio session
-        self._stop_radio()
-
         if not url:
             p_log("ERROR", f"URL for station {station_name} not found.")
             return f"URL for station {station_name} not found."
+        if _VLC_INSTANCE is None:
+            p_log("ERROR", "libVLC could not be initialized; is VLC installed?")
+            return "Error starting radio: VLC could not be initialized."
     
         try:
-            # Wait a moment to ensure previous thread is fully terminated
-            time.sleep(0.5)
+            # Stop the previous station; a running track monitor is kept and picks up the new one
+            self._detach_metadata_listener()
+            self.player.stop()
     
-            self.player = vlc.MediaPlayer(url)
+            media = self._media_cache.get(url)
+            if media is None:
+                media = _VLC_INSTANCE.media_new(url)
+                self._media_cache[url] = media
+            # The player is created once and kept for the plugin lifetime
+            if self.player is _NULL_PLAYER:
+                self.player = _VLC_INSTANCE.media_player_new()
+            self.player.set_media(media)
             self.player.play()
-#            default_volume = self.settings.get('default_volume', DEFAULT_VOLUME)
-#            self.player.audio_set_volume(default_volume)
-            # Set volume to default if self.volume is not set
-            volume = getattr(self, 'volume', self.settings.get('default_volume', DEFAULT_VOLUME))
+            self._attach_metadata_listener(media)
+            # Keep the last volume set, or use the default one
+            volume = self._default_volume if self.volume is None else self.volume
             self.player.audio_set_volume(volume)
             self.current_station = station_name
             self.playing = True
-            self.stop_monitor.clear()  # Reset the stop event
-            # Reset title repeat count for new station
-            self._title_repeat_count = {}
             # Ensure command_triggered is set to True for both new plays and station changes
             self.monitor_state.command_triggered = True
             self.monitor_state.reset_for_station_change(station_name)
+            self.monitor_state.announce_after = time.monotonic() + COMMAND_RESPONSE_DELAY
             self._radio_state = {
-                    "current_station": station_name,
-                    "current_title": None,
-                    "last_updated": 0.0,
-                    "command_triggered": True
-                }
-            # Create and start a new monitor thread if not already running
-            if not self.enable_announcements_action or not self.settings.get('enable_radio_plugin', ENABLED):
+                **_EMPTY_RADIO_STATE,
+                "current_station": station_name,
+                "command_triggered": True
+            }
+            if not self._announcements_enabled:
                 p_log("INFO", "Radio plugin announcements are disabled; not starting track monitor.")
             else:
-                if not self.track_monitor_thread or not self.track_monitor_thread.is_alive():
-                    self.track_monitor_thread = threading.Thread(
-                        target=self._monitor_track_changes, 
-                        args=(helper,),
-                        daemon=True  # Make thread daemon so it exits when main thread exits
-                    )
-                    self.track_monitor_thread.start()
+                self._ensure_track_monitor(helper)
     
             p_log("INFO", f"Started playing {station_name} at volume {volume}")
             return f"Playing {station_name}."
         except Exception as e:
             p_log("ERROR", f"Failed to start radio: {e}")
             return f"Error starting radio: {e}"
+    def _ensure_track_monitor(self, helper: PluginHelper):
+        """Start the track monitor once per chat, or wake the running one."""
+        thread = self.track_monitor_thread
+        if thread and thread.is_alive() and not self.stop_monitor.is_set():
+            # Let the running monitor notice the station change right away
+            self._monitor_wakeup.set()
+            return
+        # A monitor stopped with the last chat may still be finishing a fetch; it exits on its own
+        self.stop_monitor = threading.Event()
+        self.track_monitor_thread = threading.Thread(
+            target=self._monitor_track_changes,
+            args=(helper, self.stop_monitor),
+            daemon=True  # Make thread daemon so it exits when main thread exits
+        )
+        self.track_monitor_thread.start()
+
     def _stop_radio(self):
         try:
-            # Set flag to stop monitoring thread
-            self.stop_monitor.set()
-        
-            # Stop player if it exists
-            if self.player:
-                self.player.stop()
-                self.player = None
+            # Stop the player, keeping it around for the next station
+            self._detach_metadata_listener()
+            self.player.stop()
             
             self.playing = False
             self.current_station = None
             self.monitor_state.command_triggered = False
             
             # Clear in-memory state
-            self._radio_state ={
-                "current_station": None,
-                "current_title": None,
-                "last_updated": 0.0,
-                "command_triggered": False
-            }
-            # Reset title repeat count
-            self._title_repeat_count = {}
-            # Wait for thread to terminate with timeout
-            if self.track_monitor_thread and self.track_monitor_thread.is_alive():
-                self.track_monitor_thread.join(timeout=2)
+            self._radio_state = dict(_EMPTY_RADIO_STATE)
+            # Let the track monitor park until the next station; no join on the caller's thread
+            self._monitor_wakeup.set()
             
             p_log("INFO", "Stopped radio")
             return "Radio stopped."
@@ -663,7 +739,7 @@ class RadioPlugin(PluginBase):
     def _set_volume(self, volume: int):
         """Set the playback volume safely, even during stream startup."""
         try:
-            if not self.player:
+            if not self.playing:
                 p_log("ERROR", "No active player to set volume.")
                 return "No active player to set volume."
 
@@ -671,62 +747,118 @@ class RadioPlugin(PluginBase):
             result = self.player.audio_set_volume(volume)
 
             if result == -1:
-                time.sleep(0.5)
-                result = self.player.audio_set_volume(volume)
+                # VLC is still starting the stream; retry shortly without blocking the caller
+                self._pending_volume = volume
+                self._schedule_volume_retry(volume, VOLUME_RETRY_ATTEMPTS)
+                p_log("INFO", f"Volume change to {volume} queued, player not ready yet")
+                return f"Volume change to {volume} queued; the player is still starting."
 
-            if result == -1:
-                p_log("ERROR", "VLC refused volume change (player not ready).")
-                return "Unable to set volume right now."
-            # Wait a moment to ensure volume is applied
-            time.sleep(0.2)
-            actual = self.player.audio_get_volume()
-            
             # Store volume in instance for future use
-            self.volume = actual
-            p_log("INFO", f"Volume set to {actual} (requested {volume})")
-            return f"Volume set to {actual}"
+            self.volume = volume
+            self._pending_volume = None
+            p_log("INFO", f"Volume set to {volume}")
+            return f"Volume set to {volume}"
 
         except Exception as e:
             p_log("ERROR", f"Error setting volume: {e}")
             return f"Error setting volume: {e}"
+    def _schedule_volume_retry(self, volume: int, attempts_left: int):
+        """Try the volume change again after VOLUME_RETRY_DELAY, off the caller's thread."""
+        retry = threading.Timer(VOLUME_RETRY_DELAY, self._retry_volume, args=(volume, attempts_left))
+        retry.daemon = True
+        retry.start()
+    def _retry_volume(self, volume: int, attempts_left: int):
+        """Retry a queued volume change from a timer thread until VLC accepts it.
+
+        Gives up when playback stops, a newer volume change is requested, or the attempts run out.
+        """
+        if not self.playing or volume != self._pending_volume:
+            return
+        if self.player.audio_set_volume(volume) != -1:
+            self.volume = volume
+            self._pending_volume = None
+            p_log("INFO", f"Volume set to {volume}")
+        elif attempts_left > 1:
+            self._schedule_volume_retry(volume, attempts_left - 1)
+        else:
+            self._pending_volume = None
+            p_log("ERROR", f"VLC refused volume change to {volume} (player not ready).")
+    # -----------------------------------------------------------------
+    # VLC metadata events
+    # -----------------------------------------------------------------
+    def _attach_metadata_listener(self, media):
+        """Wake the track monitor as soon as VLC reports new stream metadata."""
+        if not media:
+            return
+        self._vlc_meta_dirty = True
+        try:
+            em = media.event_manager()
+            em.event_attach(vlc.EventType.MediaMetaChanged, self._on_media_meta_changed)
+            self._media_event_manager = em
+        except Exception as e:
+            p_log("ERROR", f"Unable to attach VLC metadata listener: {e}")
+
+    def _detach_metadata_listener(self):
+        """Remove the metadata listener from the current media, if any."""
+        if self._media_event_manager is None:
+            return
+        try:
+            self._media_event_manager.event_detach(vlc.EventType.MediaMetaChanged)
+        except Exception as e:
+            p_log("ERROR", f"Unable to detach VLC metadata listener: {e}")
+        self._media_event_manager = None
+
+    def _on_media_meta_changed(self, event):
+        """libVLC callback: only signal the monitor, libVLC is not re-entrant."""
+        meta_type = event.u.media_meta_changed.meta_type
+        if meta_type == vlc.Meta.Title or meta_type == vlc.Meta.NowPlaying:
+            self._vlc_meta_dirty = True
+            self._monitor_wakeup.set()
+
+    def _wait_for_next_check(self, timeout: float, stop: threading.Event) -> bool:
+        """Wait up to timeout seconds; return True if woken early by a metadata change."""
+        woken = self._monitor_wakeup.wait(timeout)
+        if stop.is_set():
+            # Leave the wakeup set for a monitor started after this one
+            return False
+        if woken:
+            # Some ICY streams send the same title several times in a row; let the burst settle
+            stop.wait(META_DEBOUNCE_INTERVAL)
+        self._monitor_wakeup.clear()
+        return woken and not stop.is_set()
     # -----------------------------------------------------------------
     # Track monitoring
     # -----------------------------------------------------------------
-    def _monitor_track_changes(self, helper: PluginHelper):
-        """Monitor VLC metadata and trigger an event when the track changes."""
+    def _monitor_track_changes(self, helper: PluginHelper, stop: threading.Event):
+        """Monitor VLC metadata and trigger an event when the track changes, until stop is set."""
         state = self.monitor_state
     
-        # If a command just triggered the play or change, wait before the monitor starts announcing tracks
-        if state.command_triggered:
-            p_log("DEBUG", f"Delaying initial check by {COMMAND_RESPONSE_DELAY} seconds to allow AI response to command")
-            for _ in range(COMMAND_RESPONSE_DELAY):
-                if self.stop_monitor.is_set():
-                    return
-                time.sleep(1)
-#            state.command_triggered = False # Moved to after first announcement to ensure it's honored
-    
         # Initialize state for the current station
         state.reset_for_station_change(self.current_station)
     
         p_log("INFO", f"Track monitor started for {state.current_station}. Lazy mode active with interval {state.lazy_interval}s")
          
         # Main monitoring loop
-        while not self.stop_monitor.is_set():
+        while not stop.is_set():
             try:
-                if not self.player or self.stop_monitor.is_set():
-                    time.sleep(1)  # Check more frequently if we should stop
+                # Nothing playing or announcements off: sleep until woken or stopped
+                if not self.playing or not self._announcements_enabled:
+                    self._monitor_wakeup.wait()
+                    if not stop.is_set():
+                        self._monitor_wakeup.clear()
                     continue
                 
-                current_time = time.time()
-                # Get current check interval based on monitoring mode
-                check_interval = state.current_interval
-                
-                # Skip if not enough time has passed since last check
-                if current_time - state.last_check_time < check_interval:
-                    time.sleep(1)
+                current_time = time.monotonic()
+                # If a command just triggered the play or change, wait before announcing tracks
+                hold = state.announce_after - current_time
+                if hold > 0:
+                    if _DEBUG_ENABLED:
+                        p_log("DEBUG", f"Delaying check by {hold:.1f} seconds to allow AI response to command")
+                    self._wait_for_next_check(hold, stop)
                     continue
                 
-                state.last_check_time = current_time
+                # Get current check interval based on monitoring mode
+                check_interval = state.current_interval
                 
                 # Check if station changed
                 if self.current_station != state.current_station:
@@ -734,157 +866,157 @@ class RadioPlugin(PluginBase):
                     state.reset_for_station_change(self.current_station)
                 
                 # Get track info based on station type
-                display_title = self._get_track_info(state.current_station)
+                station = state.current_station
+                display_title = self._get_track_info(station, state.station_kind)
                 
-                if not display_title:
-                    time.sleep(1)
-                    continue
+                # Stopped during the fetch: a newer monitor may already own the state
+                if stop.is_set():
+                    break
                 
-                # Normalize title for comparison
-                normalized_title = self.normalize_title(display_title)
+                # Drop the result if the station was changed while it was being fetched
+                if station != self.current_station or state.announce_after > current_time:
+                    continue
                 
-                # Process the track based on monitoring mode
-                self._process_track_update(helper, state, display_title, normalized_title)
+                if display_title:
+                    # Normalize title for comparison; unchanged tracks reuse the last result
+                    memo_title, normalized_title = self._norm_memo
+                    if display_title != memo_title:
+                        normalized_title = self.normalize_title(display_title)
+                        self._norm_memo = (display_title, normalized_title)
+                    
+                    # Process the track based on monitoring mode
+                    self._process_track_update(helper, state, display_title, normalized_title)
                 
-                # Sleep for the appropriate interval
-                time.sleep(check_interval)
+                # Sleep for the appropriate interval, or until VLC reports new metadata
+                if self._wait_for_next_check(check_interval, stop):
+                    p_log("DEBUG", "VLC metadata changed, checking track immediately")
                 
             except Exception as e:
                 p_log("ERROR", f"Track monitor error: {e}")
-                time.sleep(5)
+                # Back off after an error, but return at once if the monitor is stopped
+                stop.wait(5)
         
         p_log("INFO", f"Track monitor stopped for {state.current_station}.")
         
-    def _get_track_info(self, station_name: str) -> str:
-        """Get the current track info based on station type."""
+    def _get_track_info(self, station_name: str, station_kind: Optional[str]) -> str:
+        """Get the current track info from the retriever of the station type resolved at station change."""
         if not station_name:
             return ""
-        
-        # Use specialized retrievers for special stations
-        if self.is_somafm_station(station_name):
-            p_log("DEBUG", f"Using SomaFM track retriever for {station_name}")
-            return somaretriever.get_somafm_track_info(station_name)
-        elif self.is_hutton_station(station_name):
-            p_log("DEBUG", f"Using Hutton Orbital Radio track retriever for {station_name}")
-            return huttonretriever.get_hutton_track_info()
-        elif self.is_deejay_station(station_name):
-            p_log("DEBUG", f"Using Radio Deejay track retriever for {station_name}")
-            return deejayretriever.get_deejay_track_info(station_name)
-        elif self.is_mp3_stream(station_name):
-            p_log("DEBUG", f"Using MP3 stream track retriever for {station_name}")
-            url = RADIO_STATIONS[station_name].get("url", "")
-            from . import mp3_stream_track_retriever as mp3retriever
-            return mp3retriever.get_track_info(url)
-        else:
-            # Use VLC metadata for standard stations
-            try:
-                if not self.player:
-                    return ""
-                
-                media = self.player.get_media()
-                if not media:
-                    return ""
-                
-                title = media.get_meta(vlc.Meta.Title)
-                now_playing = media.get_meta(vlc.Meta.NowPlaying)
-                return now_playing or title or ""
-            except Exception as e:
-                p_log("ERROR", f"Error getting VLC metadata: {e}")
+        if _DEBUG_ENABLED:
+            p_log("DEBUG", f"Using {station_kind or 'VLC metadata'} track retriever for {station_name}")
+        return self._track_fetchers[station_kind](station_name)
+    
+    @staticmethod
+    def _get_mp3_title(station_name: str) -> str:
+        """Read the ICY title of a generic MP3 stream."""
+        from . import mp3_stream_track_retriever as mp3retriever
+        return mp3retriever.get_track_info(_STATION_URLS[station_name])
+    
+    def _get_vlc_title(self, station_name: str) -> str:
+        """Read the title of a standard station from VLC metadata."""
+        try:
+            if not self.playing:
+                return ""
+            
+            # Metadata unchanged since the last read, reuse it
+            if not self._vlc_meta_dirty:
+                return self._vlc_title
+            
+            media = self.player.get_media()
+            if not media:
                 return ""
+            
+            self._vlc_meta_dirty = False
+            title = media.get_meta(vlc.Meta.Title)
+            now_playing = media.get_meta(vlc.Meta.NowPlaying)
+            self._vlc_title = now_playing or title or ""
+            return self._vlc_title
+        except Exception as e:
+            p_log("ERROR", f"Error getting VLC metadata: {e}")
+            return ""
     
     def _process_track_update(self, helper: PluginHelper, state: MonitorState, display_title: str, normalized_title: str):
         """Process a track update based on the current monitoring mode."""
-        current_time = time.time()
-        command_triggered = state.command_triggered
+        current_time = time.monotonic()
     
         # In lazy mode: check if title changed from previous check
         if state.is_lazy_mode:
             # First check in lazy mode - store the title and always announce
             if state.prev_check_title is None:
-                state.prev_check_title = normalized_title
-                p_log("DEBUG", f"First lazy check: stored baseline '{normalized_title}'")
-            
-                # Always announce the track on first check (like in original code)
-                self._announce_track(helper, display_title, state.current_station, command_triggered)
-                state.command_triggered = False
-                state.last_title = normalized_title
-                state.last_event_time = current_time
+                if _DEBUG_ENABLED:
+                    p_log("DEBUG", f"First lazy check: stored baseline '{normalized_title}'")
+                self._announce_change(helper, state, display_title, normalized_title, current_time)
                 return
             
             # Compare with previous check
             if normalized_title != state.prev_check_title:
                 # Title changed - announce and reset counter
-                p_log("DEBUG", f"Title changed in lazy mode: '{state.prev_check_title}' -> '{normalized_title}'")
-                self._announce_track(helper, display_title, state.current_station, command_triggered)
-                state.prev_check_title = normalized_title
-                state.last_title = normalized_title
-                state.last_event_time = current_time
-                state.checks_without_change = 0
-                state.command_triggered = False
+                if _DEBUG_ENABLED:
+                    p_log("DEBUG", f"Title changed in lazy mode: '{state.prev_check_title}' -> '{normalized_title}'")
+                state.record_track_change(current_time)
+                self._announce_change(helper, state, display_title, normalized_title, current_time)
             else:
                 # Title unchanged - increment counter
                 state.checks_without_change += 1
-                p_log("DEBUG", f"Title unchanged in lazy mode ({state.checks_without_change} checks)")
+                if _DEBUG_ENABLED:
+                    p_log("DEBUG", f"Title unchanged in lazy mode ({state.checks_without_change} checks)")
                 
                 # After two unchanged checks, switch to active mode
                 if state.checks_without_change >= 2:
                     state.is_lazy_mode = False
-                    p_log("DEBUG", f"Switching to active mode (interval: {state.active_interval}s)")
+                    if _DEBUG_ENABLED:
+                        p_log("DEBUG", f"Switching to active mode (interval: {state.active_interval}s)")
         
         # In active mode: check if title changed from last announced title
         else:
             # If title changed from last announced, announce and switch back to lazy mode
-            if normalized_title != state.last_title or command_triggered:
-                p_log("DEBUG", f"Title changed in active mode: '{state.last_title}' -> '{normalized_title}'")
-                self._announce_track(helper, display_title, state.current_station, command_triggered)
-                state.last_title = normalized_title
-                state.last_event_time = current_time
-                state.command_triggered = False
-                
-                # Switch back to lazy mode
-                state.is_lazy_mode = True
-                state.checks_without_change = 0
-                state.prev_check_title = normalized_title
-                p_log("DEBUG", f"Switching back to lazy mode (interval: {state.lazy_interval}s)")
+            if normalized_title != state.last_title or state.command_triggered:
+                if _DEBUG_ENABLED:
+                    p_log("DEBUG", f"Title changed in active mode: '{state.last_title}' -> '{normalized_title}'")
+                if normalized_title != state.last_title:
+                    state.record_track_change(current_time)
+                self._announce_change(helper, state, display_title, normalized_title, current_time)
+                if _DEBUG_ENABLED:
+                    p_log("DEBUG", f"Switching back to lazy mode (interval: {state.lazy_interval}s)")
+    
+    def _announce_change(self, helper: PluginHelper, state: MonitorState, display_title: str, normalized_title: str, now: float):
+        """Announce a track and make it the new lazy-mode baseline."""
+        self._announce_track(helper, display_title, state.current_station, state.command_triggered)
+        state.command_triggered = False
+        state.last_title = normalized_title
+        state.last_event_time = now
+        state.prev_check_title = normalized_title
+        state.checks_without_change = 0
+        state.is_lazy_mode = True
     
     def _announce_track(self, helper: PluginHelper, title: str, station: str, command_triggered: bool):
         """Announce a track change by dispatching an event."""
         try:
             if not title or len(title.strip()) < MIN_TITLE_LENGTH:
-                p_log("DEBUG", f"Not announcing invalid title: '{title}'")
+                if _DEBUG_ENABLED:
+                    p_log("DEBUG", f"Not announcing invalid title: '{title}'")
                 return
             
             p_log("INFO", f"Announcing track: '{title}' on {station} (command triggered: {command_triggered})")
         
             # Create and dispatch the event
+            now = time.time()
             event = PluginEvent(
                 kind="plugin",
                 plugin_event_name="radio_changed",
-                plugin_event_content=[title, station, command_triggered, time.time()]
+                plugin_event_content=[title, station, command_triggered, now]
             )
-        
-            # Clear the state to ensure the event is processed
-            self._radio_state = {
-                "current_station": None,
-                "current_title": None,
-                "last_updated": 0.0,
-                "command_triggered": False
-            }
-        
-            # Dispatch the event
             helper.dispatch_event(event)
         
-            # Wait a short time to ensure event processing starts
-            time.sleep(0.5)
-        
             # Now update the state
-            self._radio_state.update({
+            self._radio_state = {
                 "current_station": station,
                 "current_title": title,
-                "last_updated": time.time(),
+                "last_updated": now,
                 "command_triggered": command_triggered
-            })
+            }
         
-            p_log("DEBUG", f"Event dispatched successfully. Updated _radio_state: {self._radio_state}")
+            if _DEBUG_ENABLED:
+                p_log("DEBUG", f"Event dispatched successfully. Updated _radio_state: {self._radio_state}")
         except Exception as e:
             p_log("ERROR", f"Error announcing track: {e}")
\ No newline at end of file
@@ -1,23 +1,52 @@
 import os
 import ctypes
+from ctypes.util import find_library
+
+# Set once the libraries have been found and loaded, so repeated checks return at once
+_vlc_checked = False
+
+# Usual install directory of VLC on Windows, which is normally not on PATH
+_WINDOWS_VLC_DIR = os.path.join(os.environ.get("ProgramFiles", r"C:\Program Files"), "VideoLAN", "VLC")
+
+def _find_vlc_library(name):
+    """
+    Locate a VLC library ("vlc" or "vlccore") on the system search path.
+    On Windows the DLLs are named libvlc.dll/libvlccore.dll and find_library only searches PATH,
+    so also look next to the script (portable builds) and in the VLC install directory.
+    """
+    if os.name != "nt":
+        return find_library(name)
+
+    dll = f"lib{name}.dll"
+    path = find_library(f"lib{name}")
+    if path is None:
+        for folder in (os.getcwd(), _WINDOWS_VLC_DIR):
+            candidate = os.path.join(folder, dll)
+            if os.path.isfile(candidate):
+                path = candidate
+                break
+    return path
 
 def check_vlc_dlls():
-    dlls = ["libvlc.dll", "libvlccore.dll"]
-    missing = []
-    for dll in dlls:
-        if not os.path.isfile(dll):
-            missing.append(dll)
+    global _vlc_checked
+    if _vlc_checked:
+        print("✅ VLC DLLs already loaded.")
+        return
+
+    libs = {name: _find_vlc_library(name) for name in ("vlc", "vlccore")}
+    missing = [f"lib{name}" for name, path in libs.items() if path is None]
 
     if missing:
         print(f"Missing DLLs: {', '.join(missing)}")
         return
 
     try:
-        ctypes.CDLL("libvlc.dll")
-        ctypes.CDLL("libvlccore.dll")
+        for path in libs.values():
+            ctypes.CDLL(path)
+        _vlc_checked = True
         print("✅ VLC DLLs loaded successfully.")
     except Exception as e:
         print(f"❌ Failed to load VLC DLLs: {e}")
 
 if __name__ == "__main__":
-    check_vlc_dlls()
\ No newline at end of file
+    check_vlc_dlls()
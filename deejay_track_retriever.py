@@ -62,7 +62,7 @@ def get_deejay_track_info(station_name: str = None) -> str:
     is_linetti = station_name and "linetti" in station_name.lower()
     url = LINETTI_URL if is_linetti else DEFAULT_URL
     
-    now = time.time()
+    now = time.monotonic()
     cache_key = url  # Use URL as cache key
     
     # Check cache
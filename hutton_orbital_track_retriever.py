@@ -13,6 +13,7 @@ def get_hutton_track_info():
     Gets the currently playing track on Hutton Orbital Radio.
     Returns just the stream title.
     """
+    session = response = None
     try:
         # Create a session to handle cookies and redirects
         session = requests.Session()
@@ -60,6 +61,12 @@ def get_hutton_track_info():
         
     except Exception:
         return "Unavailable"
+    finally:
+        # The stream never ends on its own; drop the connection once the metadata is read
+        if response is not None:
+            response.close()
+        if session is not None:
+            session.close()
 
 if __name__ == "__main__":
     print("Now Playing:", get_hutton_track_info())
\ No newline at end of file
@@ -11,8 +11,19 @@ Optimized to reduce API calls and improve efficiency.
 import requests
 import time
 import re
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional, Tuple, Any
 
+# orjson is optional; it decodes the polled JSON faster than the standard library
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Shared session so polling reuses one keep-alive connection to somafm.com
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
 # Cache to store track information and reduce API calls
 _track_cache: Dict[str, Tuple[str, float]] = {}
 # Cache for station IDs to avoid repeated extraction
@@ -25,6 +36,23 @@ _channels_cache_timestamp: float = 0
 _TRACK_CACHE_EXPIRY = 20
 _CHANNELS_CACHE_EXPIRY = 300  # 5 minutes
 
+# Failing endpoints are skipped for a while instead of costing a timeout on every poll
+_REQUEST_TIMEOUT = (2, 3)  # connect, read seconds
+_FAILURE_COOLDOWN = 60  # seconds skipped per consecutive failure
+_MAX_COOLDOWN_STEPS = 8  # cap on the cooldown multiplier
+# Failure state per endpoint URL as (last failure time, consecutive failures)
+_endpoint_failures: Dict[str, Tuple[float, int]] = {}
+# Last body per endpoint URL as (ETag, Last-Modified, decoded data), for conditional requests
+_conditional_cache: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+
+# Patterns used to derive station IDs from station names
+_SOMAFM_NAME_RE = re.compile(r'SomaFM\s+(.+)', re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+# Deletes every ASCII character except lowercase letters and digits
+_NON_ALNUM_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isdigit() or 'a' <= chr(c) <= 'z')
+))
+
 
 def get_somafm_track_info(station_name: str) -> str:
     """
@@ -39,10 +67,11 @@ def get_somafm_track_info(station_name: str) -> str:
     # Extract station ID from full name if needed
     station_id = _get_station_id(station_name)
     
-    # Check cache first
+    # Check cache first; monotonic time so clock adjustments can't stretch or skip the TTL
+    now = time.monotonic()
     if station_id in _track_cache:
         cached_info, timestamp = _track_cache[station_id]
-        if time.time() - timestamp < _TRACK_CACHE_EXPIRY:
+        if now - timestamp < _TRACK_CACHE_EXPIRY:
             return cached_info
     
     # Try to get track information using the most efficient method first
@@ -54,10 +83,10 @@ def get_somafm_track_info(station_name: str) -> str:
     
     # Update cache if we got information
     if track_info:
-        _track_cache[station_id] = (track_info, time.time())
+        _track_cache[station_id] = (track_info, now)
     else:
         # If we couldn't get any info, cache an empty string to prevent repeated failed attempts
-        _track_cache[station_id] = ("", time.time())
+        _track_cache[station_id] = ("", now)
         
     return track_info or ""
 
@@ -81,40 +110,85 @@ def _extract_station_id(station_name: str) -> str:
     # Handle common SomaFM station names
     if "SomaFM" in station_name:
         # Extract the part after "SomaFM " if present
-        match = re.search(r'SomaFM\s+(.+)', station_name, re.IGNORECASE)
+        match = _SOMAFM_NAME_RE.search(station_name)
         if match:
-            name_part = match.group(1).lower()
-            # Convert spaces to underscores and remove special characters
-            return re.sub(r'[^a-z0-9]', '', name_part.replace(' ', ''))
+            # Drop spaces and special characters in one pass
+            return _alnum_only(match.group(1).lower())
     
     # For URLs, extract the last part
     if "/" in station_name:
         return station_name.split("/")[-1].lower()
     
     # Default: just lowercase and remove spaces/special chars
-    return re.sub(r'[^a-z0-9]', '', station_name.lower().replace(' ', ''))
+    return _alnum_only(station_name.lower())
+
+
+def _alnum_only(text: str) -> str:
+    """Keep only lowercase ASCII letters and digits."""
+    # translate is a plain table lookup; the regex only handles the rare non-ASCII name
+    if text.isascii():
+        return text.translate(_NON_ALNUM_TABLE)
+    return _NON_ALNUM_RE.sub('', text)
+
+
+def _fetch_json(url: str) -> Optional[Any]:
+    """
+    GET a SomaFM JSON endpoint and return the decoded body.
+    Returns None on failure, or without a request while the endpoint is cooling down.
+    """
+    failure = _endpoint_failures.get(url)
+    if failure:
+        last_failure, failure_count = failure
+        if time.monotonic() - last_failure < _FAILURE_COOLDOWN * min(failure_count, _MAX_COOLDOWN_STEPS):
+            return None
+    
+    # Ask the server to skip the body if it is the one we already have
+    headers = {}
+    cached = _conditional_cache.get(url)
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
+    try:
+        response = _SESSION.get(url, headers=headers, timeout=_REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached:
+            _endpoint_failures.pop(url, None)
+            return cached[2]
+        if response.status_code == 200:
+            data = _json.loads(response.content)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                _conditional_cache[url] = (etag, last_modified, data)
+            _endpoint_failures.pop(url, None)
+            return data
+    except Exception:
+        pass
+    
+    _endpoint_failures[url] = (time.monotonic(), failure[1] + 1 if failure else 1)
+    return None
 
 
 def _get_from_json_api(station_id: str) -> Optional[str]:
     """Try to get track info from the primary SomaFM JSON API."""
+    data = _fetch_json(f"http://somafm.com/songs/{station_id}.json")
     try:
-        url = f"http://somafm.com/songs/{station_id}.json"
-        response = requests.get(url, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            if "songs" in data and len(data["songs"]) > 0:
-                song = data["songs"][0]  # Get the most recent song
-                artist = song.get('artist', '')
-                title = song.get('title', '')
-                album = song.get('album', '')
-                
-                if artist and title:
-                    if album:
-                        return f"{artist} - {title} [{album}]"
-                    else:
-                        return f"{artist} - {title}"
-                elif title:
-                    return title
+        if data and "songs" in data and len(data["songs"]) > 0:
+            song = data["songs"][0]  # Get the most recent song
+            artist = song.get('artist', '')
+            title = song.get('title', '')
+            album = song.get('album', '')
+            
+            if artist and title:
+                if album:
+                    return f"{artist} - {title} [{album}]"
+                else:
+                    return f"{artist} - {title}"
+            elif title:
+                return title
     except Exception:
         pass
     
@@ -128,20 +202,17 @@ def _get_from_channels_api(station_id: str) -> Optional[str]:
     """
     global _channels_cache, _channels_cache_timestamp
     
-    current_time = time.time()
+    current_time = time.monotonic()
     
     # Check if we need to refresh the channels cache
     if not _channels_cache or (current_time - _channels_cache_timestamp > _CHANNELS_CACHE_EXPIRY):
-        try:
-            url = "http://somafm.com/channels.json"
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                _channels_cache = response.json()
-                _channels_cache_timestamp = current_time
-        except Exception:
+        data = _fetch_json("http://somafm.com/channels.json")
+        if data:
+            _channels_cache = data
+            _channels_cache_timestamp = current_time
+        elif not _channels_cache:
             # If the API call fails, keep using the old cache if available
-            if not _channels_cache:
-                return None
+            return None
     
     # Use the cached channels data
     try: